@@ -1,20 +1,36 @@
 import os
 import json
+import asyncio
+import hashlib
+import logging
+import re
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from typing import Literal
 from dotenv import load_dotenv
+from diskcache import Cache
+import orjson
 
 # LangChain (modern LCEL)
-from langchain_core.prompts import PromptTemplate
+from langchain_core.prompts import ChatPromptTemplate
 from langchain_groq import ChatGroq
+from pydantic import BaseModel, field_validator
 
 # Dependencies
 import yfinance as yf
-import praw
 import tweepy  # For X scanning
 
 load_dotenv()
 
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger("camillo")
+
 # ────────────────────────────────────────────────
 # Secrets from GitHub Secrets
 # ────────────────────────────────────────────────
@@ -33,14 +49,40 @@ TWITTER_API_SECRET    = os.getenv("TWITTER_API_SECRET")
 TWITTER_ACCESS_TOKEN  = os.getenv("TWITTER_ACCESS_TOKEN")
 TWITTER_ACCESS_SECRET = os.getenv("TWITTER_ACCESS_SECRET")
 
+# Shared HTTP session: keep-alive + connection pooling for Serper/Reddit/Discord
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+))
+
 # LLM Setup
+LLM_MODEL = "llama-3.1-70b-versatile"  # Stable fast model; change if needed
 llm = ChatGroq(
-    model="llama-3.1-70b-versatile",  # Stable fast model; change if needed
+    model=LLM_MODEL,
     api_key=GROQ_API_KEY,
-    temperature=0.7,
+    temperature=0,  # deterministic so cached answers match a fresh call
     max_tokens=500
 )
 
+# Cheap triage model: only keywords it scores >= TRIAGE_PROMOTE_SCORE go to the 70B model
+TRIAGE_MODEL = "llama-3.1-8b-instant"
+TRIAGE_PROMOTE_SCORE = 6
+llm_small = ChatGroq(
+    model=TRIAGE_MODEL,
+    api_key=GROQ_API_KEY,
+    temperature=0,
+    max_tokens=20  # score-only JSON
+)
+
+# Exact-match cache of parsed LLM answers (same keyword + similar buzz → same analysis)
+LLM_CACHE = Cache("./.llm_cache")
+LLM_CACHE_TTL = 86400  # 1 day
+
+# Keywords with less total buzz than this skip the LLM (when some buzz source answered)
+MIN_BUZZ = int(os.getenv("MIN_BUZZ", "3"))
+
 # Keywords (add your own Ontario/Canada ones)
 KEYWORDS = [
     "basil mask viral", "kojic acid tiktok", "peptide lotion trend",
@@ -48,14 +90,19 @@ KEYWORDS = [
     "ozempic alternative natural", "pickleball ontario", "rucking trend canada",
     "tim hortons viral item", "canadian cottage trend", "solar lawn mower"
 ]
+KEYWORDS = list(dict.fromkeys(KEYWORDS))  # drop duplicates, keep order
 
 # ────────────────────────────────────────────────
 # Helpers
 # ────────────────────────────────────────────────
 
+def elapsed_ms(t0):
+    return (time.perf_counter() - t0) * 1000
+
 def get_serper_buzz(keyword):
     if not SERPER_API_KEY:
-        return 0, "Serper key not set"
+        return None, "Serper key not set"
+    t0 = time.perf_counter()
     try:
         params = {
             "engine": "google",
@@ -64,27 +111,58 @@ def get_serper_buzz(keyword):
             "num": 8,
             "location": "Canada"
         }
-        resp = requests.get("https://google.serper.dev/search", params=params, timeout=10)
-        data = resp.json()
+        resp = SESSION.get("https://google.serper.dev/search", params=params, timeout=10)
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
         organic = len(data.get("organic", []))
         related = len(data.get("relatedSearches", [])) if "relatedSearches" in data else 0
+        logger.info("serper kw=%s ms=%d hits=%d", keyword, elapsed_ms(t0), organic + related)
         return organic + related * 2, f"{organic} organic + {related} related"
-    except Exception as e:
-        return 0, f"Serper error: {str(e)[:60]}"
+    except (requests.RequestException, ValueError) as e:
+        logger.warning("serper kw=%s ms=%d error=%s", keyword, elapsed_ms(t0), e)
+        return None, f"Serper error: {str(e)[:60]}"
 
+# App-only OAuth token, fetched once and shared by every keyword thread
+_reddit_token = {"value": None, "expires": 0}
+_reddit_token_lock = threading.Lock()
+
+def get_reddit_token():
+    with _reddit_token_lock:
+        if _reddit_token["value"] and time.time() < _reddit_token["expires"]:
+            return _reddit_token["value"]
+        resp = SESSION.post(
+            "https://www.reddit.com/api/v1/access_token",
+            auth=(REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET),
+            data={"grant_type": "client_credentials"},
+            headers={"User-Agent": REDDIT_USER_AGENT},
+            timeout=5
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        _reddit_token["value"] = data["access_token"]
+        _reddit_token["expires"] = time.time() + data.get("expires_in", 3600) - 60
+        return _reddit_token["value"]
+
+@lru_cache(maxsize=256)
 def get_reddit_buzz(keyword):
     if not REDDIT_CLIENT_ID or not REDDIT_CLIENT_SECRET:
-        return 0
+        return None
+    t0 = time.perf_counter()
     try:
-        reddit = praw.Reddit(
-            client_id=REDDIT_CLIENT_ID,
-            client_secret=REDDIT_CLIENT_SECRET,
-            user_agent=REDDIT_USER_AGENT
+        # Raw search endpoint — avoids PRAW's built-in throttling sleeps
+        resp = SESSION.get(
+            "https://oauth.reddit.com/search.json",
+            params={"q": keyword, "sort": "new", "t": "week", "limit": 10},
+            headers={"Authorization": f"bearer {get_reddit_token()}", "User-Agent": REDDIT_USER_AGENT},
+            timeout=5
         )
-        count = sum(1 for _ in reddit.subreddit("all").search(keyword, sort="new", time_filter="week", limit=10))
+        resp.raise_for_status()
+        count = len(resp.json()["data"]["children"])
+        logger.info("reddit kw=%s ms=%d hits=%d", keyword, elapsed_ms(t0), count)
         return count
-    except:
-        return 0
+    except (requests.RequestException, ValueError, KeyError) as e:
+        logger.warning("reddit kw=%s ms=%d error=%s", keyword, elapsed_ms(t0), e)
+        return None
 
 def get_x_client():
     if not all([TWITTER_API_KEY, TWITTER_API_SECRET, TWITTER_ACCESS_TOKEN, TWITTER_ACCESS_SECRET]):
@@ -99,14 +177,24 @@ def get_x_client():
 def get_x_buzz(keyword):
     client = get_x_client()
     if not client:
-        return 0, "X API not configured"
+        return None, "X API not configured"
+    t0 = time.perf_counter()
     try:
         query = f"{keyword} lang:en -is:retweet"
         tweets = client.search_recent_tweets(query=query, max_results=20)
         count = tweets.meta.get('result_count', 0) if tweets.meta else 0
+        logger.info("x kw=%s ms=%d hits=%d", keyword, elapsed_ms(t0), count)
         return count, f"{count} recent X mentions"
-    except Exception as e:
-        return 0, f"X error: {str(e)[:60]}"
+    except (tweepy.TweepyException, requests.RequestException) as e:
+        logger.warning("x kw=%s ms=%d error=%s", keyword, elapsed_ms(t0), e)
+        return None, f"X error: {str(e)[:60]}"
+
+CAMILLO_ACCOUNTS = ["ChrisCamillo", "DumbMoneyTV"]
+TWEETS_PER_ACCOUNT = 5  # latest posts checked per account
+
+# Trade-talk words that make a Camillo/DumbMoney post worth surfacing (one pass per tweet).
+# Leading boundary only, so "stocks"/"holding" still match.
+SIGNAL_RE = re.compile(r"\b(?:long|position|buying|trade|conviction|asymmetric|niche|stock|ticker|buy|sell|hold|thesis)")
 
 def check_camillo_signals():
     client = get_x_client()
@@ -114,22 +202,32 @@ def check_camillo_signals():
         return "X monitoring skipped (no API keys set)"
     
     signals = []
-    for username in ["ChrisCamillo", "DumbMoneyTV"]:
-        try:
-            user = client.get_user(username=username)
-            if not user.data:
+    t0 = time.perf_counter()
+    try:
+        # One search covers both accounts; the author expansion gives us usernames
+        # without separate get_user lookups. Pull a full page and keep each account's
+        # latest few so a busy account can't crowd the other out.
+        tweets = client.search_recent_tweets(
+            query=f"({' OR '.join(f'from:{u}' for u in CAMILLO_ACCOUNTS)}) -is:retweet",
+            max_results=100,
+            tweet_fields=['author_id', 'created_at'],
+            expansions=['author_id']
+        )
+        usernames = {u.id: u.username for u in (tweets.includes or {}).get("users", [])}
+        seen_per_author = {}
+        for tweet in tweets.data or []:
+            seen_per_author[tweet.author_id] = seen_per_author.get(tweet.author_id, 0) + 1
+            if seen_per_author[tweet.author_id] > TWEETS_PER_ACCOUNT:
                 continue
-            tweets = client.get_users_tweets(
-                id=user.data.id,
-                max_results=5,
-                tweet_fields=['created_at', 'text']
-            )
-            for tweet in tweets.data or []:
-                text = tweet.text.lower()
-                if any(kw in text for kw in ['long', 'position', 'buying', 'trade', 'conviction', 'asymmetric', 'niche', 'stock', 'ticker', 'buy', 'sell', 'hold', 'thesis']):
-                    signals.append(f"@{username} ({tweet.created_at.date()}): \"{text[:120]}...\"[](https://x.com/{username}/status/{tweet.id})")
-        except:
-            pass
+            text = tweet.text.lower()
+            username = usernames.get(tweet.author_id)
+            if SIGNAL_RE.search(text):
+                # x.com/i/status/<id> resolves without knowing the author
+                link = f"https://x.com/{username or 'i'}/status/{tweet.id}"
+                signals.append(f"@{username or 'unknown'} ({tweet.created_at.date()}): \"{text[:120]}...\"[]({link})")
+        logger.info("x-signals ms=%d tweets=%d", elapsed_ms(t0), len(tweets.data or []))
+    except (tweepy.TweepyException, requests.RequestException) as e:
+        logger.warning("x-signals ms=%d error=%s", elapsed_ms(t0), e)
     
     if signals:
         return "\n".join(signals)
@@ -138,65 +236,221 @@ def check_camillo_signals():
 # ────────────────────────────────────────────────
 # Analysis (LCEL style)
 # ────────────────────────────────────────────────
-def analyze_trend(keyword):
-    serper_score, serper_info = get_serper_buzz(keyword)
-    reddit_score = get_reddit_buzz(keyword)
-    x_score, x_info = get_x_buzz(keyword)
-    
-    total_buzz = serper_score + reddit_score * 3 + x_score * 2
-
-    prompt = PromptTemplate.from_template(
-        """
-        You are an enhanced Chris Camillo AI spotting asymmetric consumer trends early.
-        Keyword: {keyword}
-        Buzz score: {buzz_score} (Serper: {serper_info} | Reddit new posts/week: {reddit_score} | X recent mentions: {x_info})
-
-        Rate asymmetry 1-10 (10 = early viral, low coverage, big revenue potential, limited downside).
-        Output ONLY valid JSON:
-        {{
-          "asymmetry_score": int,
-          "thesis": "2-3 sentence explanation + why asymmetric",
-          "tickers": ["TICKER1 or None", "TICKER2 or None"],
-          "conviction": "high/medium/low",
-          "sources_summary": "brief buzz evidence"
-        }}
-        """
-    )
+class AsymmetrySchema(BaseModel):
+    asymmetry_score: int
+    thesis: str
+    tickers: list[str]
+    conviction: Literal["high", "medium", "low"]
+    sources_summary: str
 
-    chain = prompt | llm
+    # Tolerate near-misses ("High", null tickers) rather than discarding a paid call
+    @field_validator("conviction", mode="before")
+    @classmethod
+    def normalize_conviction(cls, v):
+        return v.strip().lower() if isinstance(v, str) else v
 
-    try:
-        response = chain.invoke({
+    @field_validator("tickers", mode="before")
+    @classmethod
+    def normalize_tickers(cls, v):
+        return [] if v is None else v
+
+class TriageSchema(BaseModel):
+    asymmetry_score: int
+
+# Static instructions go first so Groq can reuse the cached prompt prefix;
+# only the short human message changes between keywords.
+HUMAN_TEMPLATE = "Keyword: {keyword}\nBuzz: {buzz_score} (Serper: {serper_info} | Reddit: {reddit_score} | X: {x_info})"
+
+PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are an enhanced Chris Camillo AI spotting asymmetric consumer trends early.
+You are given a keyword and its buzz score (Serper results | Reddit new posts/week | X recent mentions).
+
+Rate asymmetry 1-10 (10 = early viral, low coverage, big revenue potential, limited downside).
+List up to 3 stock tickers that would benefit, or [] if there is no listed play.
+Output ONLY valid JSON:
+{{
+  "asymmetry_score": int,
+  "thesis": "2-3 sentence explanation + why asymmetric",
+  "tickers": [],
+  "conviction": "high/medium/low",
+  "sources_summary": "brief buzz evidence"
+}}"""),
+    ("human", HUMAN_TEMPLATE),
+])
+
+# Triage only asks for the score; the thesis is left to the 70B pass
+TRIAGE_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are an enhanced Chris Camillo AI triaging consumer trends for asymmetry.
+You are given a keyword and its buzz score (Serper results | Reddit new posts/week | X recent mentions).
+
+Rate asymmetry 1-10 (10 = early viral, low coverage, big revenue potential, limited downside).
+Output ONLY valid JSON: {{"asymmetry_score": int}}"""),
+    ("human", HUMAN_TEMPLATE),
+])
+
+# Compiled once; JSON mode guarantees parseable output, include_raw keeps the usage metadata
+def build_chain(prompt, model, schema):
+    return prompt | model.with_structured_output(schema, method="json_mode", include_raw=True)
+
+TRIAGE_CHAIN = build_chain(TRIAGE_PROMPT, llm_small, TriageSchema)
+CHAIN = build_chain(PROMPT, llm, AsymmetrySchema)
+
+def llm_cache_key(keyword, total_buzz):
+    # Bucket the buzz so small day-to-day wobbles still hit the cache
+    payload = {"kw": keyword, "buzz": total_buzz // 5, "model": [TRIAGE_MODEL, LLM_MODEL]}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+def source_result(source, keyword, result, fallback):
+    if isinstance(result, Exception):
+        logger.warning("%s kw=%s unexpected error=%r", source, keyword, result)
+        return fallback
+    return result
+
+async def prepare_trend(keyword):
+    # Fetch all buzz sources at once so we only wait on the slowest one
+    serper, reddit, x = await asyncio.gather(
+        asyncio.to_thread(get_serper_buzz, keyword),
+        asyncio.to_thread(get_reddit_buzz, keyword),
+        asyncio.to_thread(get_x_buzz, keyword),
+        return_exceptions=True
+    )
+    # An unexpected error in one source counts as no data instead of aborting the scan
+    serper_score, serper_info = source_result("serper", keyword, serper, (None, "Serper error"))
+    reddit_score = source_result("reddit", keyword, reddit, None)
+    x_score, x_info = source_result("x", keyword, x, (None, "X error"))
+    
+    # None = source not configured or failed, as opposed to a genuine 0
+    live_sources = [score for score in (serper_score, reddit_score, x_score) if score is not None]
+    total_buzz = (serper_score or 0) + (reddit_score or 0) * 3 + (x_score or 0) * 2
+
+    trend = {
+        "keyword": keyword,
+        "inputs": {
             "keyword": keyword,
             "buzz_score": total_buzz,
             "serper_info": serper_info,
-            "reddit_score": reddit_score,
+            "reddit_score": reddit_score if reddit_score is not None else "n/a",
             "x_info": x_info
-        })
-        content = response.content.strip()
-        if content.startswith("```json"):
-            content = content.split("```json")[1].split("```")[0].strip()
-        return json.loads(content)
-    except Exception as e:
-        return {
+        },
+        "cache_key": llm_cache_key(keyword, total_buzz),
+        "analysis": None
+    }
+
+    # Only trust a low score when at least one source actually answered
+    if live_sources and total_buzz < MIN_BUZZ:
+        trend["analysis"] = {
             "asymmetry_score": 0,
-            "thesis": f"Error: {str(e)[:80]}",
+            "thesis": "insufficient buzz",
             "tickers": [],
             "conviction": "low",
-            "sources_summary": ""
+            "sources_summary": serper_info
         }
+        return trend
+
+    trend["analysis"] = LLM_CACHE.get(trend["cache_key"])
+    return trend
+
+def failed_analysis(e):
+    return {
+        "asymmetry_score": 0,
+        "thesis": f"Error: {str(e)[:80]}",
+        "tickers": [],
+        "conviction": "low",
+        "sources_summary": ""
+    }
 
+def triage_analysis(trend, score):
+    return {
+        "asymmetry_score": score,
+        "thesis": "Triage score only (no full analysis)",
+        "tickers": [],
+        "conviction": "low",
+        "sources_summary": trend["inputs"]["serper_info"]
+    }
+
+async def analyze_trends(trends):
+    # Triage everything on the small model, then analyze only the promising ones on 70B
+    promoted = []
+    for trend, result in zip(trends, await run_chain(TRIAGE_CHAIN, trends)):
+        if isinstance(result, Exception):
+            trend["analysis"] = failed_analysis(result)
+            continue
+        trend["analysis"] = triage_analysis(trend, result.asymmetry_score)
+        if result.asymmetry_score >= TRIAGE_PROMOTE_SCORE:
+            promoted.append(trend)
+        else:
+            LLM_CACHE.set(trend["cache_key"], trend["analysis"], expire=LLM_CACHE_TTL)
+
+    if promoted:
+        for trend, result in zip(promoted, await run_chain(CHAIN, promoted)):
+            # An unverified 8B score must never be reported as a signal
+            if isinstance(result, Exception):
+                trend["analysis"] = failed_analysis(result)
+                continue
+            trend["analysis"] = result.model_dump()
+            LLM_CACHE.set(trend["cache_key"], trend["analysis"], expire=LLM_CACHE_TTL)
+
+async def run_chain(chain, trends):
+    # Every keyword goes out in one concurrent batch; returns parsed models or exceptions
+    t0 = time.perf_counter()
+    responses = await chain.abatch(
+        [t["inputs"] for t in trends],
+        config={"max_concurrency": 8},
+        return_exceptions=True
+    )
+    logger.info("llm batch size=%d ms=%d", len(trends), elapsed_ms(t0))
+    results = []
+    for trend, response in zip(trends, responses):
+        try:
+            if isinstance(response, Exception):
+                raise response
+            if response["parsing_error"]:
+                raise response["parsing_error"]
+            raw = response["raw"]
+            cached_tokens = (raw.usage_metadata or {}).get("input_token_details", {}).get("cache_read", 0)
+            logger.info("llm kw=%s cached_tokens=%d", trend["keyword"], cached_tokens)
+            results.append(response["parsed"])
+        except Exception as e:  # Groq API, JSON-mode and schema errors all land here
+            logger.warning("llm kw=%s error=%s", trend["keyword"], e)
+            results.append(e)
+    return results
+
+async def scan_keywords():
+    # One event loop for every keyword × source fan-out, then one LLM batch.
+    # Size the to_thread pool so every blocking source call can be in flight at once
+    # (the default is min(32, cpu_count + 4), i.e. 6 threads on a 2-vCPU runner).
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=len(KEYWORDS) * 3))
+    trends = await asyncio.gather(*(prepare_trend(kw) for kw in KEYWORDS))
+    pending = [t for t in trends if t["analysis"] is None]
+    if pending:
+        await analyze_trends(pending)
+    return [t["analysis"] for t in trends]
+
+def valid_ticker(ticker):
+    return bool(ticker) and ticker.lower() != "none"
+
+@lru_cache(maxsize=256)
 def get_stock_info(ticker):
+    t0 = time.perf_counter()
     try:
-        info = yf.Ticker(ticker).info
-        price = info.get("currentPrice", "N/A")
-        mcap = info.get("marketCap", "N/A")
-        if mcap != "N/A":
-            mcap = f"${mcap:,}"
+        # fast_info only pulls price/cap data instead of the full .info profile
+        fi = yf.Ticker(ticker).fast_info
+        price = f"{fi.last_price:.2f}" if fi.last_price is not None else "N/A"
+        mcap = f"${int(fi.market_cap):,}" if fi.market_cap is not None else "N/A"
+        logger.info("yfinance ticker=%s ms=%d", ticker, elapsed_ms(t0))
         return f"{ticker} | ${price} | MktCap {mcap}"
-    except:
+    except Exception as e:  # yfinance surfaces lookup failures as many unrelated types
+        logger.warning("yfinance ticker=%s ms=%d error=%s", ticker, elapsed_ms(t0), e)
         return f"{ticker} — data unavailable"
 
+def get_stock_infos(tickers):
+    # Every play in the report, deduplicated and fetched concurrently
+    tickers = sorted({t.upper() for t in tickers})
+    if not tickers:
+        return {}
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        return dict(zip(tickers, ex.map(get_stock_info, tickers)))
+
 # ────────────────────────────────────────────────
 # Main
 # ────────────────────────────────────────────────
@@ -205,35 +459,41 @@ def main():
 
     report_lines = ["**Daily Asymmetric Scan Report** (Serper + Reddit + X)"]
 
-    found_signals = False
+    # Each keyword is network-bound (Serper, Reddit, X, Groq) — scan them concurrently
+    analyses = asyncio.run(scan_keywords())
 
-    for kw in KEYWORDS:
-        analysis = analyze_trend(kw)
-        score = analysis.get("asymmetry_score", 0)
+    signals = [(kw, a) for kw, a in zip(KEYWORDS, analyses) if a.get("asymmetry_score", 0) >= 7]
+    info_by_sym = get_stock_infos(t for _, a in signals for t in a.get("tickers", []) if valid_ticker(t))
 
-        if score >= 7:
-            found_signals = True
-            tickers = analysis.get("tickers", [])
-            tickers_info = [get_stock_info(t) for t in tickers if t and t.lower() != "none"]
-            report_lines.append(f"\n🔥 **{kw.upper()}** — Score: {score}/10 ({analysis.get('conviction', 'unknown')})")
-            report_lines.append(f"Thesis: {analysis.get('thesis', 'No thesis')}")
-            report_lines.append(f"Buzz: {analysis.get('sources_summary', 'No sources')}")
-            if tickers_info:
-                report_lines.append("Plays:\n" + "\n".join(tickers_info))
-            report_lines.append("-" * 60)
+    for kw, analysis in signals:
+        score = analysis.get("asymmetry_score", 0)
+        tickers = analysis.get("tickers", [])
+        tickers_info = [info_by_sym[t.upper()] for t in tickers if valid_ticker(t)]
+        report_lines.append(f"\n🔥 **{kw.upper()}** — Score: {score}/10 ({analysis.get('conviction', 'unknown')})")
+        report_lines.append(f"Thesis: {analysis.get('thesis', 'No thesis')}")
+        report_lines.append(f"Buzz: {analysis.get('sources_summary', 'No sources')}")
+        if tickers_info:
+            report_lines.append("Plays:\n" + "\n".join(tickers_info))
+        report_lines.append("-" * 60)
 
     # Add Camillo/DumbMoney check
     camillo_update = check_camillo_signals()
     report_lines.append(f"\n**Camillo & DumbMoney X Check**:\n{camillo_update}")
 
-    if not found_signals:
+    if not signals:
         report_lines.append("\nNo high-asymmetry signals today — keep scanning!")
 
     # Send to Discord
     if DISCORD_WEBHOOK:
-        payload = {"content": "\n".join(report_lines)}
+        payload = orjson.dumps({"content": "\n".join(report_lines)})
         try:
-            requests.post(DISCORD_WEBHOOK, json=payload, timeout=10)
+            resp = SESSION.post(
+                DISCORD_WEBHOOK,
+                data=payload,
+                headers={"Content-Type": "application/json"},
+                timeout=10
+            )
+            resp.raise_for_status()
             print("Report sent to Discord")
         except Exception as e:
             print(f"Discord send failed: {e}")